@@ -1,7 +1,7 @@
-from .base import BaseCollector
+from .base import BaseCollector, fetch_all
 from .nvd_collector import NVDCollector
 from .thn_collector import THNCollector
 from .github_collector import GitHubCollector
 from .kisa_collector import KISACollector
 
-__all__ = ["BaseCollector", "NVDCollector", "THNCollector", "GitHubCollector", "KISACollector"]
+__all__ = ["BaseCollector", "fetch_all", "NVDCollector", "THNCollector", "GitHubCollector", "KISACollector"]
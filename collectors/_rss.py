@@ -0,0 +1,125 @@
+"""
+RSS 피드 스트리밍 파서
+feedparser 대신 필요한 필드만 추출하여 가벼운 dict로 반환
+"""
+
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterator, Optional
+
+import requests
+from urllib3.exceptions import DecodeError, HTTPError, ProtocolError, ReadTimeoutError
+
+# RSS 1.0 (RDF) 항목의 고유 ID 속성
+_RDF_ABOUT = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about"
+
+# 항목 요소 이름 (RSS 1.0/2.0: item, Atom: entry)
+_ENTRY_TAGS = {"item", "entry"}
+
+# 요소 이름 → 항목 dict 키 (같은 키는 먼저 나온 값 우선)
+_FIELD_MAP = {
+    "title": "title",
+    "link": "link",
+    "description": "description",
+    "summary": "description",
+    "guid": "id",
+    "id": "id",
+    "pubDate": "published",
+    "date": "published",       # dc:date
+    "published": "published",
+    "updated": "published",
+}
+
+
+def iter_rss(url: str, session: requests.Session = None, timeout: int = 30) -> Iterator[dict]:
+    """RSS/Atom 피드를 스트리밍으로 파싱하여 항목 dict를 하나씩 반환
+
+    항목 dict 키: title, link, description, id, published (없으면 생략)
+    session을 넘기면 같은 호스트에 대한 연결을 재사용
+    본문을 읽는 중 끊기면 이미 반환한 항목은 유지되고 requests 예외가 발생
+    """
+    http = session or requests
+    with http.get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+
+        try:
+            for _, elem in ET.iterparse(response.raw, events=("end",)):
+                if _local_name(elem.tag) not in _ENTRY_TAGS:
+                    continue
+
+                yield _parse_entry(elem)
+                # 처리한 항목의 하위 요소 해제
+                elem.clear()
+        except HTTPError as e:
+            # response.raw를 직접 읽으므로 requests가 하던 예외 변환을 여기서 수행
+            raise _as_requests_error(e) from e
+
+
+def parse_date(date_str: Optional[str]) -> Optional[datetime]:
+    """RSS 날짜 문자열 파싱 (RFC 822 pubDate 또는 ISO 8601 dc:date)
+
+    모든 수집기의 published_at이 같은 형태가 되도록 naive 로컬 시간으로 반환
+    """
+    if not date_str:
+        return None
+
+    try:
+        parsed = parsedate_to_datetime(date_str)
+        # "-0000" 오프셋은 naive로 반환되지만 RFC 5322상 UTC 시각
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return _to_naive_local(parsed)
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        # 2024-01-01T00:00:00Z 또는 2024-01-01 형식 (오프셋이 없으면 로컬 시간으로 간주)
+        return _to_naive_local(datetime.fromisoformat(date_str.replace("Z", "+00:00")))
+    except ValueError:
+        return None
+
+
+def _to_naive_local(value: datetime) -> datetime:
+    """timezone-aware 값을 naive 로컬 시간으로 변환 (naive 값은 그대로)"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+def _parse_entry(elem: ET.Element) -> dict:
+    """항목 요소를 dict로 변환"""
+    entry = {}
+
+    about = elem.get(_RDF_ABOUT)
+    if about:
+        entry["id"] = about
+
+    for child in elem:
+        key = _FIELD_MAP.get(_local_name(child.tag))
+        if not key or key in entry:
+            continue
+
+        # Atom은 링크를 href 속성으로 제공
+        value = (child.get("href") or child.text) if key == "link" else child.text
+        if value:
+            entry[key] = value.strip()
+
+    return entry
+
+
+def _as_requests_error(error: HTTPError) -> requests.RequestException:
+    """본문 읽기 중 발생한 urllib3 예외를 requests 예외로 변환 (Response.iter_content와 동일)"""
+    if isinstance(error, ProtocolError):
+        return requests.exceptions.ChunkedEncodingError(error)
+    if isinstance(error, DecodeError):
+        return requests.exceptions.ContentDecodingError(error)
+    if isinstance(error, ReadTimeoutError):
+        return requests.exceptions.ConnectionError(error)
+    return requests.RequestException(error)
+
+
+def _local_name(tag: str) -> str:
+    """네임스페이스를 제외한 요소 이름"""
+    return tag.rsplit("}", 1)[-1]
@@ -3,16 +3,21 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import requests
 
-import sys
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
 from models import FeedItem
 
+USER_AGENT = "security-feed/1.0"
+
 
 class BaseCollector(ABC):
     """피드 수집기 추상 베이스 클래스"""
 
+    _session: Optional[requests.Session] = None
+
     @property
     @abstractmethod
     def source_name(self) -> str:
@@ -24,6 +29,35 @@ class BaseCollector(ABC):
         """피드를 가져와 FeedItem 리스트로 변환"""
         pass
 
+    @property
+    def session(self) -> requests.Session:
+        """수집기별 HTTP 세션 (같은 호스트에 대한 keep-alive 연결 재사용)"""
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers["User-Agent"] = USER_AGENT
+        return self._session
+
     def _make_id(self, identifier: str) -> str:
         """고유 ID 생성 (source:identifier)"""
         return f"{self.source_name}:{identifier}"
+
+
+def fetch_all(collectors: List[BaseCollector]) -> List[List[FeedItem]]:
+    """여러 수집기의 fetch()를 동시에 실행 (네트워크 I/O 대기 시간 중첩)
+
+    결과는 입력된 수집기 순서대로 반환, 실패한 소스는 빈 리스트로 대체
+    """
+    if not collectors:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(collectors)) as executor:
+        return list(executor.map(_fetch_safely, collectors))
+
+
+def _fetch_safely(collector: BaseCollector) -> List[FeedItem]:
+    """수집기 하나의 실패가 다른 소스 수집을 중단시키지 않도록 예외를 기록하고 스킵"""
+    try:
+        return collector.fetch()
+    except Exception as e:
+        print(f"[ERROR] {collector.source_name} 피드 수집 실패: {e}")
+        return []
@@ -2,16 +2,14 @@
 GitHub Security Advisory GraphQL API 수집기
 """
 
+import json
 import os
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-import requests
-
-import sys
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
 from models import FeedItem
 from .base import BaseCollector
+from ._rss import parse_date
 
 
 class GitHubCollector(BaseCollector):
@@ -49,9 +47,10 @@ class GitHubCollector(BaseCollector):
     }
     """
 
-    def __init__(self, token: str = None, limit: int = 20):
+    def __init__(self, token: str = None, limit: int = 20, store_raw: bool = False):
         self.token = token or os.environ.get("GITHUB_TOKEN") or os.environ.get("ONDABOT_TOKEN")
         self.limit = limit
+        self.store_raw = store_raw
 
     @property
     def source_name(self) -> str:
@@ -64,21 +63,12 @@ class GitHubCollector(BaseCollector):
             return []
 
         try:
-            data = self._query_api()
-            if not data:
+            advisories = self._query_api()
+            if advisories is None:
                 return []
 
-            advisories = data.get("data", {}).get("securityAdvisories", {}).get("nodes", [])
-
-            items = []
-            for advisory in advisories:
-                try:
-                    item = self._parse_advisory(advisory)
-                    if item:
-                        items.append(item)
-                except Exception as e:
-                    print(f"[ERROR] GitHub Advisory 파싱 실패: {e}")
-                    continue
+            # 응답 노드를 순회하며 바로 FeedItem으로 변환 (경계에서만 리스트로 수집)
+            items = list(self._iter_items(advisories))
 
             print(f"[INFO] GitHub Advisory에서 {len(items)}개 항목 수집")
             return items
@@ -87,25 +77,41 @@ class GitHubCollector(BaseCollector):
             print(f"[ERROR] GitHub API 호출 실패: {e}")
             return []
 
-    def _query_api(self) -> Optional[dict]:
-        """GraphQL API 호출"""
+    def _iter_items(self, advisories: List[dict]) -> Iterator[FeedItem]:
+        """Advisory 노드를 FeedItem으로 하나씩 변환"""
+        for advisory in advisories:
+            try:
+                item = self._parse_advisory(advisory)
+                if item:
+                    yield item
+            except Exception as e:
+                print(f"[ERROR] GitHub Advisory 파싱 실패: {e}")
+                continue
+
+    def _query_api(self) -> Optional[List[dict]]:
+        """GraphQL API 호출, advisory 노드 목록 반환"""
         headers = {
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json",
         }
 
-        response = requests.post(
+        with self.session.post(
             self.API_URL,
             json={"query": self.QUERY, "variables": {"first": self.limit}},
             headers=headers,
             timeout=30,
-        )
+            stream=True,
+        ) as response:
+            if response.status_code != 200:
+                print(f"[ERROR] GitHub API 응답 오류: {response.status_code}")
+                return None
 
-        if response.status_code != 200:
-            print(f"[ERROR] GitHub API 응답 오류: {response.status_code}")
-            return None
+            # 본문을 문자열로 한 번 더 디코딩하지 않고 스트림에서 바로 파싱
+            response.raw.decode_content = True
+            data = json.load(response.raw)
 
-        return response.json()
+        # 필요한 노드 목록만 남기고 나머지 응답은 바로 해제
+        return ((data.get("data") or {}).get("securityAdvisories") or {}).get("nodes", [])
 
     def _parse_advisory(self, advisory: dict) -> FeedItem:
         """Advisory를 FeedItem으로 변환"""
@@ -139,7 +145,7 @@ class GitHubCollector(BaseCollector):
             description=description,
             url=advisory.get("permalink", f"https://github.com/advisories/{ghsa_id}"),
             published_at=published_at,
-            raw_data=advisory,
+            raw_data=advisory if self.store_raw else None,
         )
 
     def _get_affected_packages(self, advisory: dict) -> List[str]:
@@ -154,12 +160,5 @@ class GitHubCollector(BaseCollector):
         return packages
 
     def _parse_date(self, date_str: str) -> datetime:
-        """ISO 8601 날짜 파싱"""
-        if not date_str:
-            return datetime.now()
-
-        try:
-            # 2024-01-01T00:00:00Z 형식
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except ValueError:
-            return datetime.now()
+        """ISO 8601 날짜 파싱 (2024-01-01T00:00:00Z 형식, naive 로컬 시간)"""
+        return parse_date(date_str) or datetime.now()
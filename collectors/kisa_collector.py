@@ -5,16 +5,18 @@ KISA 보호나라 RSS 피드 수집기
 """
 
 import re
+import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import List
 from urllib.parse import parse_qs, urlparse
 
-import feedparser
+import requests
 
-import sys
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
 from models import FeedItem
 from .base import BaseCollector
+from ._rss import iter_rss, parse_date
+
+_CVE_RE = re.compile(r"CVE-\d{4}-\d+", re.IGNORECASE)
 
 
 class KISACollector(BaseCollector):
@@ -25,8 +27,9 @@ class KISACollector(BaseCollector):
         "vulnerability": "https://www.boho.or.kr/kr/rss.do?bbsId=B0000302",
     }
 
-    def __init__(self, feed_urls: dict = None):
+    def __init__(self, feed_urls: dict = None, store_raw: bool = False):
         self.feed_urls = feed_urls or self.FEEDS
+        self.store_raw = store_raw
 
     @property
     def source_name(self) -> str:
@@ -37,24 +40,22 @@ class KISACollector(BaseCollector):
         items = []
 
         for feed_type, url in self.feed_urls.items():
-            feed = feedparser.parse(url)
-
-            if feed.bozo:
-                print(f"[WARN] KISA {feed_type} 피드 파싱 경고: {feed.bozo_exception}")
-
-            for entry in feed.entries:
-                try:
-                    item = self._parse_entry(entry, feed_type)
-                    if item:
-                        items.append(item)
-                except Exception as e:
-                    print(f"[ERROR] KISA {feed_type} 항목 파싱 실패: {e}")
-                    continue
+            try:
+                for entry in iter_rss(url, self.session):
+                    try:
+                        item = self._parse_entry(entry, feed_type)
+                        if item:
+                            items.append(item)
+                    except Exception as e:
+                        print(f"[ERROR] KISA {feed_type} 항목 파싱 실패: {e}")
+                        continue
+            except (requests.RequestException, ET.ParseError) as e:
+                print(f"[ERROR] KISA {feed_type} 피드 수집 실패: {e}")
 
         print(f"[INFO] KISA 보호나라에서 {len(items)}개 항목 수집")
         return items
 
-    def _parse_entry(self, entry, feed_type: str) -> FeedItem:
+    def _parse_entry(self, entry: dict, feed_type: str) -> FeedItem:
         """RSS 항목을 FeedItem으로 변환"""
         title = entry.get("title", "").strip()
         link = entry.get("link", "")
@@ -76,7 +77,7 @@ class KISACollector(BaseCollector):
             description=description,
             url=link,
             published_at=published_at,
-            raw_data=dict(entry),
+            raw_data=entry if self.store_raw else None,
         )
 
     def _extract_ntt_id(self, url: str) -> str:
@@ -91,21 +92,9 @@ class KISACollector(BaseCollector):
             pass
         return None
 
-    def _parse_date(self, entry) -> datetime:
+    def _parse_date(self, entry: dict) -> datetime:
         """발행 시간 파싱 (KISA는 YYYY-MM-DD 형식)"""
-        if hasattr(entry, "published_parsed") and entry.published_parsed:
-            from time import mktime
-            return datetime.fromtimestamp(mktime(entry.published_parsed))
-
-        # pubDate 텍스트에서 직접 파싱
-        date_str = entry.get("published", entry.get("pubDate", ""))
-        if date_str:
-            try:
-                return datetime.strptime(date_str.strip(), "%Y-%m-%d")
-            except ValueError:
-                pass
-
-        return datetime.now()
+        return parse_date(entry.get("published")) or datetime.now()
 
     def _build_description(self, title: str, feed_type: str) -> str:
         """title 기반으로 description 보강"""
@@ -117,7 +106,7 @@ class KISACollector(BaseCollector):
             parts.append("[KISA 취약점 정보]")
 
         # CVE ID 추출
-        cve_match = re.search(r"CVE-\d{4}-\d+", title, re.IGNORECASE)
+        cve_match = _CVE_RE.search(title)
         if cve_match:
             parts.append(f"CVE: {cve_match.group(0).upper()}")
 
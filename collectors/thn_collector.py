@@ -3,16 +3,20 @@ The Hacker News RSS 피드 수집기
 """
 
 import hashlib
+import html
+import re
+import xml.etree.ElementTree as ET
 from datetime import datetime
-from time import mktime
 from typing import List
 
-import feedparser
+import requests
 
-import sys
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
 from models import FeedItem
 from .base import BaseCollector
+from ._rss import iter_rss, parse_date
+
+# HTML 태그 (script/style은 내용까지 포함)
+_TAG_RE = re.compile(r"<(script|style)\b.*?</\1\s*>|<[^>]+>", re.IGNORECASE | re.DOTALL)
 
 
 class THNCollector(BaseCollector):
@@ -20,8 +24,9 @@ class THNCollector(BaseCollector):
 
     DEFAULT_URL = "https://feeds.feedburner.com/TheHackersNews"
 
-    def __init__(self, feed_url: str = None):
+    def __init__(self, feed_url: str = None, store_raw: bool = False):
         self.feed_url = feed_url or self.DEFAULT_URL
+        self.store_raw = store_raw
 
     @property
     def source_name(self) -> str:
@@ -29,28 +34,26 @@ class THNCollector(BaseCollector):
 
     def fetch(self) -> List[FeedItem]:
         """THN RSS 피드를 가져와 FeedItem 리스트로 변환"""
-        feed = feedparser.parse(self.feed_url)
-
-        if feed.bozo:
-            print(f"[WARN] THN 피드 파싱 경고: {feed.bozo_exception}")
-
         items = []
-        for entry in feed.entries:
-            try:
-                item = self._parse_entry(entry)
-                if item:
-                    items.append(item)
-            except Exception as e:
-                print(f"[ERROR] THN 항목 파싱 실패: {e}")
-                continue
+        try:
+            for entry in iter_rss(self.feed_url, self.session):
+                try:
+                    item = self._parse_entry(entry)
+                    if item:
+                        items.append(item)
+                except Exception as e:
+                    print(f"[ERROR] THN 항목 파싱 실패: {e}")
+                    continue
+        except (requests.RequestException, ET.ParseError) as e:
+            print(f"[ERROR] THN 피드 수집 실패: {e}")
 
         print(f"[INFO] The Hacker News에서 {len(items)}개 항목 수집")
         return items
 
-    def _parse_entry(self, entry) -> FeedItem:
+    def _parse_entry(self, entry: dict) -> FeedItem:
         """RSS 항목을 FeedItem으로 변환"""
         # guid 또는 link로 고유 ID 생성
-        identifier = entry.get("id", entry.get("guid", ""))
+        identifier = entry.get("id", "")
         if not identifier:
             # fallback: URL 해시
             identifier = hashlib.md5(entry.get("link", "").encode()).hexdigest()[:12]
@@ -59,7 +62,7 @@ class THNCollector(BaseCollector):
         published_at = self._parse_date(entry)
 
         # 설명에서 HTML 태그 제거
-        description = self._clean_html(entry.get("description", entry.get("summary", "")))
+        description = self._clean_html(entry.get("description", ""))
 
         return FeedItem(
             id=self._make_id(identifier),
@@ -68,24 +71,16 @@ class THNCollector(BaseCollector):
             description=description,
             url=entry.get("link", ""),
             published_at=published_at,
-            raw_data=dict(entry),
+            raw_data=entry if self.store_raw else None,
         )
 
-    def _parse_date(self, entry) -> datetime:
-        """발행 시간 파싱"""
-        if hasattr(entry, "published_parsed") and entry.published_parsed:
-            return datetime.fromtimestamp(mktime(entry.published_parsed))
-
-        if hasattr(entry, "updated_parsed") and entry.updated_parsed:
-            return datetime.fromtimestamp(mktime(entry.updated_parsed))
-
-        return datetime.now()
+    def _parse_date(self, entry: dict) -> datetime:
+        """발행 시간 파싱 (pubDate, RFC 822)"""
+        return parse_date(entry.get("published")) or datetime.now()
 
     def _clean_html(self, text: str) -> str:
         """HTML 태그 제거"""
-        import re
-        # HTML 태그 제거
-        clean = re.sub(r"<[^>]+>", "", text)
-        # 연속 공백 정리
-        clean = re.sub(r"\s+", " ", clean).strip()
-        return clean
+        # HTML 태그 제거 후 엔티티 디코딩 (&amp; → &)
+        clean = html.unescape(_TAG_RE.sub("", text))
+        # 연속 공백 정리 (split/join은 정규식 치환보다 빠르고 앞뒤 공백도 함께 제거)
+        return " ".join(clean.split())
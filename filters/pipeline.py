@@ -3,11 +3,10 @@
 기술 스택 필터 + 점수 계산을 통합
 """
 
+import hashlib
 from dataclasses import dataclass
 from typing import List, Dict, Tuple
 
-import sys
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
 from models import FeedItem
 from .tech_filter import TechStackFilter, FilterResult
 from .score_calculator import ScoreCalculator, ScoreResult
@@ -30,7 +29,7 @@ class PipelineResult:
 
     @property
     def severity(self) -> str:
-        return ScoreCalculator().get_severity_level(self.score)
+        return ScoreCalculator.get_severity_level(self.score)
 
     @property
     def should_analyze_with_llm(self) -> bool:
@@ -41,35 +40,61 @@ class PipelineResult:
 class FilterPipeline:
     """필터링 파이프라인"""
 
+    # 필터/점수 결과 캐시 최대 크기
+    CACHE_MAX_SIZE = 4096
+
     def __init__(
         self,
         tech_keywords: Dict[str, List[str]],
         security_keywords: Dict[str, List[str]] = None,
         min_score_for_llm: int = 3,
+        max_scan_chars: int = ScoreCalculator.DEFAULT_MAX_SCAN_CHARS,
     ):
-        self.tech_filter = TechStackFilter(tech_keywords)
-        self.score_calculator = ScoreCalculator(security_keywords)
+        self.tech_filter = TechStackFilter(tech_keywords, max_scan_chars)
+        self.score_calculator = ScoreCalculator(security_keywords, max_scan_chars=max_scan_chars)
         self.min_score_for_llm = min_score_for_llm
+        self.max_scan_chars = max_scan_chars
+        # ((제목, 설명) 다이제스트, any_match_only) → (기술 필터 결과, 점수 결과)
+        # 결과는 텍스트와 생성 시점의 키워드에만 의존하므로 소스 간 중복 게시물도 재사용
+        self._cache: Dict[Tuple[bytes, bool], Tuple[FilterResult, ScoreResult]] = {}
 
-    def process(self, items: List[FeedItem]) -> List[PipelineResult]:
+    def process(self, items: List[FeedItem], any_match_only: bool = False) -> List[PipelineResult]:
         """전체 항목 처리"""
-        results = []
-        for item in items:
-            result = self.process_single(item)
-            results.append(result)
-        return results
+        return [self.process_single(item, any_match_only) for item in items]
 
-    def process_single(self, item: FeedItem) -> PipelineResult:
-        """단일 항목 처리"""
-        tech_result = self.tech_filter.filter(item)
-        score_result = self.score_calculator.calculate(item)
+    def process_single(self, item: FeedItem, any_match_only: bool = False) -> PipelineResult:
+        """단일 항목 처리
 
+        Args:
+            any_match_only: 기술 필터 통과 여부만 필요할 때 True
+                (첫 번째 키워드를 찾으면 나머지 키워드 검사 생략)
+        """
+        key = (self._cache_key(item), any_match_only)
+        cached = self._cache.get(key)
+        if cached is None:
+            # 소문자 변환된 검사용 텍스트를 한 번만 만들어 두 단계에서 공유
+            scan_text = f"{item.title} {item.description}"[:self.max_scan_chars].lower()
+            cached = (
+                self.tech_filter.filter(item, any_match_only=any_match_only, scan_text=scan_text),
+                self.score_calculator.calculate(item, scan_text=scan_text),
+            )
+            if len(self._cache) >= self.CACHE_MAX_SIZE:
+                # 가장 오래된 항목 제거
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = cached
+
+        tech_result, score_result = cached
         return PipelineResult(
             item=item,
             tech_filter_result=tech_result,
             score_result=score_result,
         )
 
+    def _cache_key(self, item: FeedItem) -> bytes:
+        """캐시 키 생성 (제목 + 설명 다이제스트)"""
+        content = f"{item.title}\0{item.description}".encode()
+        return hashlib.blake2b(content, digest_size=16).digest()
+
     def filter_for_llm(self, items: List[FeedItem]) -> Tuple[List[PipelineResult], List[PipelineResult]]:
         """
         LLM 분석 대상과 비대상으로 분리
@@ -77,7 +102,8 @@ class FilterPipeline:
         Returns:
             (llm_candidates, filtered_out)
         """
-        results = self.process(items)
+        # 분리에는 기술 필터 통과 여부만 필요
+        results = self.process(items, any_match_only=True)
 
         llm_candidates = []
         filtered_out = []
@@ -93,13 +119,18 @@ class FilterPipeline:
     def get_stats(self, results: List[PipelineResult]) -> Dict:
         """처리 결과 통계"""
         total = len(results)
-        passed_tech = sum(1 for r in results if r.passed_tech_filter)
-        llm_candidates = sum(1 for r in results if r.should_analyze_with_llm)
+        passed_tech = 0
+        llm_candidates = 0
 
+        # 한 번의 순회로 집계
         severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
         for r in results:
-            if r.passed_tech_filter:
-                severity_counts[r.severity] += 1
+            if not r.passed_tech_filter:
+                continue
+            passed_tech += 1
+            severity_counts[r.severity] += 1
+            if r.should_analyze_with_llm:
+                llm_candidates += 1
 
         return {
             "total": total,
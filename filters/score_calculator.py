@@ -4,12 +4,13 @@
 
 import re
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Optional, Pattern, Tuple
 
-import sys
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
 from models import FeedItem
 
+# CVE-XXXX-XXXXX 패턴
+_CVE_RE = re.compile(r"cve-\d{4}-\d+", re.IGNORECASE)
+
 
 @dataclass
 class ScoreResult:
@@ -30,19 +31,47 @@ class ScoreCalculator:
         "urgent_keyword": 1,    # urgent 키워드
     }
 
+    # 점수 계산에 사용할 최대 텍스트 길이 (제목 + 설명 앞부분)
+    # 비정상적으로 긴 RSS 본문이 들어와도 항목당 검사 비용이 일정하도록 제한
+    DEFAULT_MAX_SCAN_CHARS = 8192
+
     def __init__(
         self,
         security_keywords: Dict[str, List[str]] = None,
         weights: Dict[str, int] = None,
+        max_scan_chars: int = DEFAULT_MAX_SCAN_CHARS,
     ):
         """
         Args:
             security_keywords: 심각도별 키워드
                 {"critical": [...], "high": [...], "urgent": [...]}
             weights: 점수 가중치
+            max_scan_chars: 검사할 최대 텍스트 길이 (초과분은 무시)
         """
         self.security_keywords = security_keywords or self._default_keywords()
         self.weights = weights or self.DEFAULT_WEIGHTS
+        self.max_scan_chars = max_scan_chars
+        # 키워드와 가중치는 생성 후 바뀌지 않으므로 점수 규칙을 미리 계산
+        # (weight_key, 점수, 정규식, 소문자 → 원본 키워드) 목록, 키워드 없는 심각도는 제외
+        # 심각도별 키워드는 하나의 정규식으로 묶어 텍스트를 한 번만 스캔
+        self._cve_points = self.weights["cve_pattern"]
+        self._keyword_rules = []
+        for bucket in ("critical", "high", "urgent"):
+            compiled = self._compile_keywords(self.security_keywords.get(bucket, []))
+            if compiled:
+                weight_key = f"{bucket}_keyword"
+                self._keyword_rules.append((weight_key, self.weights[weight_key], *compiled))
+
+    def _compile_keywords(self, keywords: List[str]) -> Optional[Tuple[Pattern, Dict[str, str]]]:
+        """키워드 목록을 (alternation 정규식, 소문자 → 원본 키워드 매핑)으로 변환"""
+        lowered = {}
+        for keyword in keywords:
+            lowered.setdefault(keyword.lower(), keyword)
+        if not lowered:
+            return None
+
+        pattern = re.compile("|".join(re.escape(k) for k in lowered))
+        return pattern, lowered
 
     def _default_keywords(self) -> Dict[str, List[str]]:
         """기본 보안 키워드"""
@@ -76,47 +105,33 @@ class ScoreCalculator:
             ],
         }
 
-    def calculate(self, item: FeedItem) -> ScoreResult:
-        """항목의 보안 점수 계산"""
-        text = f"{item.title} {item.description}".lower()
+    def calculate(self, item: FeedItem, scan_text: Optional[str] = None) -> ScoreResult:
+        """항목의 보안 점수 계산
+
+        Args:
+            scan_text: 미리 만든 소문자 검사용 텍스트 (없으면 항목에서 생성)
+        """
+        text = scan_text
+        if text is None:
+            text = f"{item.title} {item.description}"[:self.max_scan_chars].lower()
 
         score = 0
         breakdown = {}
         matched_keywords = []
 
         # CVE 패턴 체크
-        if re.search(r"cve-\d{4}-\d+", text, re.IGNORECASE):
-            points = self.weights["cve_pattern"]
-            score += points
-            breakdown["cve_pattern"] = points
+        if _CVE_RE.search(text):
+            score += self._cve_points
+            breakdown["cve_pattern"] = self._cve_points
             matched_keywords.append("CVE")
 
-        # Critical 키워드 체크 (하나라도 있으면 점수 부여)
-        for keyword in self.security_keywords.get("critical", []):
-            if keyword.lower() in text:
-                points = self.weights["critical_keyword"]
-                score += points
-                breakdown["critical_keyword"] = points
-                matched_keywords.append(keyword)
-                break  # 한 번만 점수 부여
-
-        # High 키워드 체크
-        for keyword in self.security_keywords.get("high", []):
-            if keyword.lower() in text:
-                points = self.weights["high_keyword"]
-                score += points
-                breakdown["high_keyword"] = points
-                matched_keywords.append(keyword)
-                break
-
-        # Urgent 키워드 체크
-        for keyword in self.security_keywords.get("urgent", []):
-            if keyword.lower() in text:
-                points = self.weights["urgent_keyword"]
+        # 심각도별 키워드 체크 (하나라도 있으면 한 번만 점수 부여)
+        for weight_key, points, pattern, lowered in self._keyword_rules:
+            match = pattern.search(text)
+            if match:
                 score += points
-                breakdown["urgent_keyword"] = points
-                matched_keywords.append(keyword)
-                break
+                breakdown[weight_key] = points
+                matched_keywords.append(lowered[match.group(0)])
 
         return ScoreResult(
             score=score,
@@ -124,7 +139,8 @@ class ScoreCalculator:
             matched_keywords=matched_keywords,
         )
 
-    def get_severity_level(self, score: int) -> str:
+    @staticmethod
+    def get_severity_level(score: int) -> str:
         """점수에 따른 심각도 레벨 반환"""
         if score >= 5:
             return "critical"
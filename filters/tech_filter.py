@@ -2,11 +2,10 @@
 기술 스택 키워드 필터
 """
 
+import re
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Optional, Pattern
 
-import sys
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
 from models import FeedItem
 
 
@@ -21,16 +20,28 @@ class FilterResult:
 class TechStackFilter:
     """기술 스택 키워드 기반 필터"""
 
-    def __init__(self, tech_keywords: Dict[str, List[str]]):
+    # 매칭에 사용할 최대 텍스트 길이 (제목 + 설명 앞부분)
+    DEFAULT_MAX_SCAN_CHARS = 8192
+
+    def __init__(self, tech_keywords: Dict[str, List[str]], max_scan_chars: int = DEFAULT_MAX_SCAN_CHARS):
         """
         Args:
             tech_keywords: 카테고리별 키워드 딕셔너리
                 예: {"frontend": ["react", "vue"], "backend": ["nestjs", "spring"]}
+            max_scan_chars: 검사할 최대 텍스트 길이 (초과분은 무시)
         """
         self.tech_keywords = tech_keywords
+        self.max_scan_chars = max_scan_chars
         # 전체 키워드를 소문자로 평탄화
         self._all_keywords = self._flatten_keywords()
 
+        # 특수문자가 포함된 키워드는 부분 문자열로, 나머지는 단어 경계로 매칭
+        # (예: "next.js"는 그대로 검색, "go"는 "google"에 매칭되지 않도록)
+        self._special_keywords = [k for k in self._all_keywords if "." in k or "-" in k]
+        word_keywords = [k for k in self._all_keywords if not ("." in k or "-" in k)]
+        self._word_re = self._compile_word_pattern(word_keywords)
+        self._implied_keywords = self._build_implied_keywords(word_keywords)
+
     def _flatten_keywords(self) -> Dict[str, str]:
         """키워드 → 카테고리 매핑 생성"""
         keyword_to_category = {}
@@ -39,18 +50,64 @@ class TechStackFilter:
                 keyword_to_category[keyword.lower()] = category
         return keyword_to_category
 
-    def filter(self, item: FeedItem) -> FilterResult:
-        """항목이 기술 스택과 매칭되는지 확인"""
-        text = f"{item.title} {item.description}".lower()
+    def _compile_word_pattern(self, word_keywords: List[str]) -> Optional[Pattern]:
+        """일반 키워드 전체를 하나의 정규식으로 컴파일
+
+        긴 키워드를 먼저 시도하고, 전방 탐색(lookahead)으로 모든 단어 경계
+        위치를 검사하므로 겹치는 키워드(예: "spring", "spring boot")도 놓치지 않음
+        """
+        if not word_keywords:
+            return None
+
+        alternation = "|".join(re.escape(k) for k in sorted(word_keywords, key=len, reverse=True))
+        return re.compile(rf"\b(?=({alternation})\b)")
+
+    def _build_implied_keywords(self, word_keywords: List[str]) -> Dict[str, List[str]]:
+        """키워드 → 같은 위치에서 함께 매칭되는 더 짧은 키워드 목록
+
+        예: "spring boot"가 매칭되면 "spring"도 같은 위치에서 매칭됨
+        """
+        implied = {}
+        for keyword in word_keywords:
+            implied[keyword] = [
+                other for other in word_keywords
+                if other != keyword and re.match(rf"{re.escape(other)}\b", keyword)
+            ]
+        return implied
+
+    def filter(
+        self,
+        item: FeedItem,
+        any_match_only: bool = False,
+        scan_text: Optional[str] = None,
+    ) -> FilterResult:
+        """항목이 기술 스택과 매칭되는지 확인
+
+        Args:
+            any_match_only: True면 첫 번째 매칭에서 바로 반환
+                (matched_keywords에는 처음 찾은 키워드 하나만 포함)
+            scan_text: 미리 만든 소문자 검사용 텍스트 (없으면 항목에서 생성)
+        """
+        text = scan_text
+        if text is None:
+            text = f"{item.title} {item.description}"[:self.max_scan_chars].lower()
+
+        if any_match_only:
+            return self._first_match(text)
 
-        matched_keywords = []
-        matched_categories = set()
+        hits = set()
+        if self._word_re:
+            for keyword in self._word_re.findall(text):
+                hits.add(keyword)
+                hits.update(self._implied_keywords[keyword])
 
-        for keyword, category in self._all_keywords.items():
-            # 단어 경계를 고려한 매칭 (예: "go"가 "google"에 매칭되지 않도록)
-            if self._keyword_matches(keyword, text):
-                matched_keywords.append(keyword)
-                matched_categories.add(category)
+        for keyword in self._special_keywords:
+            if keyword in text:
+                hits.add(keyword)
+
+        # 설정 파일의 키워드 순서 유지
+        matched_keywords = [k for k in self._all_keywords if k in hits]
+        matched_categories = {self._all_keywords[k] for k in matched_keywords}
 
         return FilterResult(
             matched=len(matched_keywords) > 0,
@@ -58,18 +115,25 @@ class TechStackFilter:
             matched_categories=list(matched_categories),
         )
 
-    def _keyword_matches(self, keyword: str, text: str) -> bool:
-        """키워드가 텍스트에 매칭되는지 확인 (단어 경계 고려)"""
-        import re
+    def _first_match(self, text: str) -> FilterResult:
+        """첫 번째로 찾은 키워드만으로 결과 생성"""
+        keyword = None
+        if self._word_re:
+            match = self._word_re.search(text)
+            if match:
+                keyword = match.group(1)
+
+        if keyword is None:
+            keyword = next((k for k in self._special_keywords if k in text), None)
 
-        # 특수문자가 포함된 키워드는 그대로 검색 (예: "next.js", "vue.js")
-        if "." in keyword or "-" in keyword:
-            return keyword in text
+        if keyword is None:
+            return FilterResult(matched=False, matched_keywords=[], matched_categories=[])
 
-        # 일반 키워드는 단어 경계 확인
-        # "go"가 "google"에 매칭되지 않도록
-        pattern = rf"\b{re.escape(keyword)}\b"
-        return bool(re.search(pattern, text))
+        return FilterResult(
+            matched=True,
+            matched_keywords=[keyword],
+            matched_categories=[self._all_keywords[keyword]],
+        )
 
     def get_all_keywords(self) -> List[str]:
         """전체 키워드 목록 반환"""
@@ -3,21 +3,34 @@ Gemma LLM 분석기
 Google AI의 Gemma 모델을 사용하여 보안 관련성 분석
 """
 
+import hashlib
 import json
 import os
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 from google import genai
 
-import sys
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
 from models import FeedItem, AnalysisResult
 
+# ```json ... ``` 코드 블록
+_JSON_FENCE_RE = re.compile(r"```json\s*(\{.*?\})\s*```", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+# 제품명 토큰 구분자 (-, _, 공백)
+_TOKEN_SPLIT_RE = re.compile(r"[-_\s]")
+
 
 class GemmaAnalyzer:
     """Gemma LLM 분석기"""
 
+    # analyze_batch 동시 요청 수 기본값 (config.yaml.example의 llm.concurrency와 동일)
+    DEFAULT_CONCURRENCY = 4
+
+    # 프롬프트별 분석 결과 캐시 최대 크기
+    PROMPT_CACHE_SIZE = 1024
+
     PROMPT_TEMPLATE = """이 보안 취약점/뉴스에서 **영향받는 제품명**을 추출하세요.
 
 ## 기사 정보
@@ -54,12 +67,28 @@ JSON 형식으로만 응답:
 
         self.client = genai.Client(api_key=self.api_key)
         self.whitelist = [w.lower() for w in (whitelist or [])]
+        # 화이트리스트 항목별 토큰 집합 (응답마다 다시 분리하지 않도록 미리 계산)
+        self._whitelist_entries = [(w, frozenset(_TOKEN_SPLIT_RE.split(w))) for w in self.whitelist]
         self.model = model
+        # 프롬프트 다이제스트 → 분석 결과 (LRU)
+        # 여러 소스에 동시 게시된 동일 내용은 LLM을 한 번만 호출
+        self._prompt_cache: OrderedDict[bytes, AnalysisResult] = OrderedDict()
 
     def analyze(self, item: FeedItem) -> Optional[AnalysisResult]:
         """항목 분석"""
+        prompt = self._build_prompt(item)
+        key = self._prompt_key(prompt)
+        cached = self._get_cached(key)
+        if cached:
+            return cached
+
+        result = self._generate(prompt)
+        self._put_cached(key, result)
+        return result
+
+    def _generate(self, prompt: str) -> Optional[AnalysisResult]:
+        """프롬프트로 LLM 호출 후 응답 파싱"""
         try:
-            prompt = self._build_prompt(item)
             response = self.client.models.generate_content(
                 model=self.model,
                 contents=prompt,
@@ -71,6 +100,26 @@ JSON 형식으로만 응답:
             print(f"[ERROR] LLM 분석 실패: {e}")
             return None
 
+    def _prompt_key(self, prompt: str) -> bytes:
+        """프롬프트 캐시 키 (다이제스트)"""
+        return hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+
+    def _get_cached(self, key: bytes) -> Optional[AnalysisResult]:
+        """캐시된 분석 결과 조회"""
+        result = self._prompt_cache.get(key)
+        if result:
+            self._prompt_cache.move_to_end(key)
+        return result
+
+    def _put_cached(self, key: bytes, result: Optional[AnalysisResult]) -> None:
+        """분석 결과 캐시 저장 (실패한 결과는 저장하지 않음)"""
+        if not result:
+            return
+        self._prompt_cache[key] = result
+        self._prompt_cache.move_to_end(key)
+        if len(self._prompt_cache) > self.PROMPT_CACHE_SIZE:
+            self._prompt_cache.popitem(last=False)
+
     def _build_prompt(self, item: FeedItem) -> str:
         """프롬프트 생성"""
         return self.PROMPT_TEMPLATE.format(
@@ -82,19 +131,16 @@ JSON 형식으로만 응답:
         """LLM 응답 파싱 및 화이트리스트 비교"""
         try:
             # JSON 블록 추출 (```json ... ``` 형식 처리)
-            json_match = re.search(r"```json\s*(.*?)\s*```", response_text, re.DOTALL)
+            json_match = _JSON_FENCE_RE.search(response_text)
             if json_match:
-                json_str = json_match.group(1)
+                data = json.loads(json_match.group(1))
             else:
-                # 중괄호로 둘러싸인 JSON 찾기
-                json_match = re.search(r"\{[^{}]*\}", response_text)
-                if json_match:
-                    json_str = json_match.group(0)
-                else:
+                # 첫 번째 중괄호부터 JSON 객체 하나만 디코딩 (중첩 괄호 허용)
+                start = response_text.find("{")
+                if start < 0:
                     print(f"[WARN] JSON 파싱 실패: {response_text[:200]}")
                     return None
-
-            data = json.loads(json_str)
+                data, _ = _JSON_DECODER.raw_decode(response_text, start)
 
             # 추출된 제품명
             affected_product = str(data.get("affected_product", "")).lower().strip()
@@ -123,9 +169,9 @@ JSON 형식으로만 응답:
         product_lower = product.lower()
 
         # 제품명을 토큰으로 분리 (-, _, 공백 기준)
-        product_tokens = set(re.split(r'[-_\s]', product_lower))
+        product_tokens = set(_TOKEN_SPLIT_RE.split(product_lower))
 
-        for item in self.whitelist:
+        for item, item_tokens in self._whitelist_entries:
             # 정확히 일치
             if item == product_lower:
                 return True
@@ -139,7 +185,6 @@ JSON 형식으로만 응답:
             # 예: "spring boot" → ["spring", "boot"]
             #     "spring-boot-actuator" → ["spring", "boot", "actuator"]
             #     ["spring", "boot"].issubset(["spring", "boot", "actuator"]) → True
-            item_tokens = set(re.split(r'[-_\s]', item))
             if len(item_tokens) > 1 and item_tokens.issubset(product_tokens):
                 return True
 
@@ -149,11 +194,35 @@ JSON 형식으로만 응답:
 
         return False
 
-    def analyze_batch(self, items: List[FeedItem]) -> List[tuple[FeedItem, Optional[AnalysisResult]]]:
-        """여러 항목 분석 (순차 처리)"""
-        results = []
+    def analyze_batch(
+        self,
+        items: List[FeedItem],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> List[tuple[FeedItem, Optional[AnalysisResult]]]:
+        """여러 항목 분석 (최대 concurrency개 동시 요청, 입력 순서 유지)
+
+        동일한 프롬프트는 한 번만 요청하고 결과를 모든 해당 항목에 공유
+        호출마다 스레드 풀을 새로 쓰므로 같은 분석기로 여러 번 호출해도 안전
+        """
+        keys = []
+        pending = {}  # 캐시에 없는 고유 프롬프트: 키 → 프롬프트
         for item in items:
-            result = self.analyze(item)
-            results.append((item, result))
+            prompt = self._build_prompt(item)
+            key = self._prompt_key(prompt)
+            keys.append(key)
+            if key not in pending and not self._get_cached(key):
+                pending[key] = prompt
+
+        fresh = {}
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                fresh = dict(zip(pending, executor.map(self._generate, pending.values())))
+        for key, result in fresh.items():
+            self._put_cached(key, result)
+
+        results = []
+        for item, key in zip(items, keys):
+            result = fresh[key] if key in fresh else self._get_cached(key)
             print(f"[INFO] 분석 완료: {item.title[:50]}... → {result.severity if result else 'failed'}")
+            results.append((item, result))
         return results
@@ -5,6 +5,8 @@ Security Feed Automation
 """
 
 import argparse
+import copy
+import functools
 import logging
 import os
 import sys
@@ -25,7 +27,7 @@ logger = logging.getLogger(__name__)
 sys.path.insert(0, str(Path(__file__).parent))
 
 from models import FeedItem, AnalysisResult
-from collectors import NVDCollector, THNCollector, GitHubCollector, KISACollector
+from collectors import NVDCollector, THNCollector, GitHubCollector, KISACollector, fetch_all
 from filters import FilterPipeline
 from llm import GemmaAnalyzer
 from storage import DeduplicationStore
@@ -33,34 +35,46 @@ from notifier import SlackNotifier
 
 
 def load_config(config_path: str = None) -> dict:
-    """설정 파일 로드"""
+    """설정 파일 로드 (같은 경로는 프로세스 내에서 한 번만 파싱)
+
+    호출마다 캐시된 설정의 깊은 복사본을 반환하므로 호출자가 수정해도 캐시에 영향 없음
+    """
     if config_path is None:
         config_path = Path(__file__).parent / "config.yaml"
 
+    return copy.deepcopy(_load_config_cached(str(Path(config_path).resolve())))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(config_path: str) -> dict:
+    """설정 파일 파싱 결과 캐시 (load_config를 통해서만 복사본으로 사용)"""
     with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        config = yaml.safe_load(f)
+
+    # LLM 화이트리스트는 실행마다 같으므로 파싱 시 한 번만 평탄화
+    config["_whitelist_flat"] = _flatten_whitelist(config.get("whitelist", {}))
+    return config
 
 
 def collect_feeds(config: dict) -> list[FeedItem]:
-    """모든 소스에서 피드 수집"""
-    items = []
+    """모든 소스에서 피드 수집 (소스별 병렬 실행)"""
+    collectors = []
 
     feed_config = config.get("feeds", {})
+    # 원본 데이터는 디버깅할 때만 보관 (이후 단계의 메모리 사용량 절감)
+    keep_raw = config.get("debug", {}).get("keep_raw", False)
 
     # NVD
     if feed_config.get("nvd", {}).get("enabled", True):
-        collector = NVDCollector(feed_config.get("nvd", {}).get("url"))
-        items.extend(collector.fetch())
+        collectors.append(NVDCollector(feed_config.get("nvd", {}).get("url"), store_raw=keep_raw))
 
     # The Hacker News
     if feed_config.get("thehackernews", {}).get("enabled", True):
-        collector = THNCollector(feed_config.get("thehackernews", {}).get("url"))
-        items.extend(collector.fetch())
+        collectors.append(THNCollector(feed_config.get("thehackernews", {}).get("url"), store_raw=keep_raw))
 
     # GitHub Advisory
     if feed_config.get("github", {}).get("enabled", True):
-        collector = GitHubCollector()
-        items.extend(collector.fetch())
+        collectors.append(GitHubCollector(store_raw=keep_raw))
 
     # KISA 보호나라
     if feed_config.get("kisa", {}).get("enabled", True):
@@ -70,8 +84,11 @@ def collect_feeds(config: dict) -> list[FeedItem]:
             feed_urls["advisory"] = kisa_config["advisory_url"]
         if kisa_config.get("vulnerability_url"):
             feed_urls["vulnerability"] = kisa_config["vulnerability_url"]
-        collector = KISACollector(feed_urls if feed_urls else None)
-        items.extend(collector.fetch())
+        collectors.append(KISACollector(feed_urls if feed_urls else None, store_raw=keep_raw))
+
+    items = []
+    for fetched in fetch_all(collectors):
+        items.extend(fetched)
 
     return items
 
@@ -104,8 +121,8 @@ def run_pipeline(
     # 2. 중복 제거
     logger.info("[2/5] 중복 제거 중...")
     dedup_config = config.get("deduplication", {})
-    storage_path = Path(__file__).parent / dedup_config.get("storage_file", "data/processed.json")
-    dedup = DeduplicationStore(str(storage_path), dedup_config.get("retention_days", 90))
+    storage_path = Path(__file__).parent / dedup_config.get("storage_file", "data/processed.db")
+    dedup = _get_dedup_store(str(storage_path), dedup_config.get("retention_days", 90))
 
     # 오래된 항목 자동 정리
     dedup.cleanup_old_entries()
@@ -145,20 +162,32 @@ def run_pipeline(
     # 4. LLM 분석
     logger.info("[4/5] LLM 분석 중...")
     llm_config = config.get("llm", {})
-    whitelist = config.get("whitelist", {})
+    # load_config로 읽은 설정은 평탄화된 화이트리스트를 이미 포함
+    whitelist = config.get("_whitelist_flat")
+    if whitelist is None:
+        whitelist = _flatten_whitelist(config.get("whitelist", {}))
+    concurrency = _llm_concurrency(llm_config)
 
     try:
         analyzer = GemmaAnalyzer(
             model=llm_config.get("model", "gemma-3-12b-it"),
-            whitelist=_flatten_whitelist(whitelist),
+            whitelist=whitelist,
+        )
+
+        # 항목별 LLM 호출을 동시에 진행 (동시 요청 수 제한, 입력 순서 유지)
+        results = analyzer.analyze_batch(
+            [result.item for result in llm_candidates],
+            concurrency=concurrency,
         )
 
         analyzed = []
-        for result in llm_candidates:
-            analysis = analyzer.analyze(result.item)
+        alert_items = []  # critical/high 항목 (즉시 알림 대상)
+        for item, analysis in results:
             if analysis and analysis.is_relevant:
-                analyzed.append((result.item, analysis))
+                analyzed.append((item, analysis))
                 stats["llm_analyzed"] += 1
+                if analysis.severity in {"critical", "high"}:
+                    alert_items.append((item, analysis))
 
         logger.info(f"      관련 항목: {len(analyzed)}개")
 
@@ -174,10 +203,6 @@ def run_pipeline(
         mention_users=slack_config.get("mention_users", []),
     )
 
-    # critical/high 항목만 필터링
-    alert_items = [(item, analysis) for item, analysis in analyzed
-                   if analysis.severity in ["critical", "high"]]
-
     if alert_items:
         if notifier.send_batch_alerts(alert_items, dry_run=dry_run):
             stats["alerts_sent"] = len(alert_items)
@@ -198,8 +223,8 @@ def run_cleanup(config: dict) -> None:
     """오래된 데이터 정리"""
     logger.info("[정리] 오래된 항목 삭제 중...")
     dedup_config = config.get("deduplication", {})
-    storage_path = Path(__file__).parent / dedup_config.get("storage_file", "data/processed.json")
-    dedup = DeduplicationStore(str(storage_path), dedup_config.get("retention_days", 90))
+    storage_path = Path(__file__).parent / dedup_config.get("storage_file", "data/processed.db")
+    dedup = _get_dedup_store(str(storage_path), dedup_config.get("retention_days", 90))
     deleted = dedup.cleanup_old_entries()
     logger.info(f"[정리] {deleted}개 항목 삭제됨")
 
@@ -210,6 +235,22 @@ def run_daily_summary(config: dict, dry_run: bool = False) -> None:
     # TODO: 오늘 처리된 항목들을 모아서 요약 발송
 
 
+def _llm_concurrency(llm_config: dict) -> int:
+    """llm.concurrency 설정값 (1 이상의 정수, 잘못된 값이면 기본값)"""
+    value = llm_config.get("concurrency", GemmaAnalyzer.DEFAULT_CONCURRENCY)
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        logger.warning(f"llm.concurrency 값이 잘못됨 ({value!r}), 기본값 {GemmaAnalyzer.DEFAULT_CONCURRENCY} 사용")
+        return GemmaAnalyzer.DEFAULT_CONCURRENCY
+
+
+@functools.lru_cache(maxsize=None)
+def _get_dedup_store(storage_path: str, retention_days: int) -> DeduplicationStore:
+    """같은 경로의 중복 제거 저장소는 프로세스 내에서 한 번만 열어 재사용"""
+    return DeduplicationStore(storage_path, retention_days)
+
+
 def _flatten_whitelist(whitelist: dict) -> list[str]:
     """화이트리스트를 평탄화"""
     result = []
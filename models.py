@@ -2,12 +2,22 @@
 공통 데이터 모델 정의
 """
 
-from dataclasses import dataclass, field
+import re
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
 
-@dataclass
+def build_keyword_matcher(keywords: Iterable[str]) -> re.Pattern:
+    """키워드 목록을 하나의 정규식으로 컴파일 (소문자 텍스트 대상)
+
+    위치마다 가장 긴 키워드를 lookahead로 찾으므로 겹치는 키워드도 모두 검출
+    """
+    lowered = sorted({keyword.lower() for keyword in keywords}, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(re.escape, lowered)) + "))")
+
+
+@dataclass(slots=True)
 class FeedItem:
     """모든 피드 소스의 공통 인터페이스"""
     id: str                      # 고유 ID (source:identifier)
@@ -16,19 +26,25 @@ class FeedItem:
     description: str             # 설명
     url: str                     # 원본 링크
     published_at: datetime       # 발행 시간
-    raw_data: dict = field(default_factory=dict)  # 원본 데이터 (디버깅용)
+    raw_data: Optional[dict] = None  # 원본 데이터 (디버깅용, 수집기 store_raw=True일 때만)
+
+    def matches_keywords(self, keywords: list[str], matcher: Optional[re.Pattern] = None) -> list[str]:
+        """키워드 매칭 검사, 매칭된 키워드 리스트 반환
+
+        같은 키워드로 여러 항목을 검사할 때는 build_keyword_matcher 결과를 넘겨 재사용
+        """
+        if not keywords:
+            return []
+        if matcher is None:
+            matcher = build_keyword_matcher(keywords)
 
-    def matches_keywords(self, keywords: list[str]) -> list[str]:
-        """키워드 매칭 검사, 매칭된 키워드 리스트 반환"""
         text = f"{self.title} {self.description}".lower()
-        matched = []
-        for keyword in keywords:
-            if keyword.lower() in text:
-                matched.append(keyword)
-        return matched
+        # 한 위치에서는 가장 긴 키워드만 잡히므로, 그 안에 포함된 짧은 키워드도 매칭으로 간주
+        found = set(matcher.findall(text))
+        return [keyword for keyword in keywords if any(keyword.lower() in f for f in found)]
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """LLM 분석 결과"""
     is_relevant: bool            # 관련성 여부
@@ -39,10 +55,11 @@ class AnalysisResult:
     raw_response: Optional[str] = None  # LLM 원본 응답 (디버깅용)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedItem:
     """처리 완료된 항목 (중복 제거용)"""
     id: str                      # FeedItem.id
     first_seen: datetime         # 최초 발견 시간
     source: str                  # 피드 소스
     title: str                   # 제목 (로깅용)
+    content_hash: Optional[str] = None  # 제목/링크/설명 해시 (이전 버전에서 이전된 항목은 없음)
@@ -2,22 +2,32 @@
 Slack 알림 발송
 """
 
+import json
 import logging
 import os
+import re
+import time
 from typing import List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-import sys
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
 from models import FeedItem, AnalysisResult
 
 logger = logging.getLogger(__name__)
 
+_CVE_RE = re.compile(r"CVE-\d{4}-\d+", re.IGNORECASE)
+
 
 class SlackNotifier:
     """Slack 알림 발송기"""
 
+    # 429 응답 시 Retry-After만큼 기다렸다가 다시 보내는 최대 횟수
+    RATE_LIMIT_RETRIES = 3
+    # Retry-After 대기 상한 (초)
+    MAX_RETRY_AFTER = 60
+
     SEVERITY_EMOJI = {
         "critical": ":rotating_light:",  # 🚨
         "high": ":warning:",              # ⚠️
@@ -35,6 +45,22 @@ class SlackNotifier:
             logger.warning("SLACK_WEBHOOK_URL이 설정되지 않음")
 
         self.mention_users = mention_users or []
+        # 멘션 문자열은 인스턴스 수명 동안 고정
+        self._mentions_str = " ".join(f"@{user}" for user in self.mention_users)
+
+        # webhook 호출 간 연결(keep-alive) 재사용, 연결 실패와 5xx는 지수 백오프로 재시도
+        # (429는 _send_body에서 Retry-After 기준으로 처리)
+        # webhook은 멱등이 아니므로 요청 전송 후의 읽기 오류/타임아웃은 재시도하지 않음 (중복 알림 방지)
+        retry = Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["POST"],
+            raise_on_status=False,
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry))
 
     def send_alert(
         self,
@@ -47,17 +73,18 @@ class SlackNotifier:
             logger.warning("Webhook URL 없음, 알림 스킵")
             return False
 
+        if dry_run:
+            logger.info(f"[DRY-RUN] 알림 발송: {item.title[:50]}...")
+            return True
+
         emoji = self.SEVERITY_EMOJI.get(analysis.severity, ":question:")
         severity_upper = analysis.severity.upper()
 
-        # 멘션 생성 (critical/high일 때만)
-        mentions = ""
-        if analysis.severity in ["critical", "high"] and self.mention_users:
-            mentions = " ".join(f"@{user}" for user in self.mention_users)
+        # 멘션 (critical/high일 때만)
+        mentions = self._mentions_str if analysis.severity in ("critical", "high") else ""
 
         # CVE ID 추출
-        import re
-        cve_match = re.search(r"CVE-\d{4}-\d+", item.title, re.IGNORECASE)
+        cve_match = _CVE_RE.search(item.title)
         cve_id = cve_match.group(0) if cve_match else "N/A"
 
         message = {
@@ -101,10 +128,6 @@ class SlackNotifier:
                 "elements": [{"type": "mrkdwn", "text": mentions}],
             })
 
-        if dry_run:
-            logger.info(f"[DRY-RUN] 알림 발송: {item.title[:50]}...")
-            return True
-
         return self._send(message)
 
     def send_batch_alerts(
@@ -120,20 +143,22 @@ class SlackNotifier:
         if not items:
             return True
 
-        import re
-
-        # 심각도별 그룹화 (critical 먼저, 그 다음 high)
-        critical_items = [(i, a) for i, a in items if a.severity == "critical"]
-        high_items = [(i, a) for i, a in items if a.severity == "high"]
-        sorted_items = critical_items + high_items
+        # 심각도별 그룹화 (한 번 순회, critical 먼저, 그 다음 high)
+        buckets = {"critical": [], "high": []}
+        for entry in items:
+            bucket = buckets.get(entry[1].severity)
+            if bucket is not None:
+                bucket.append(entry)
+        sorted_items = buckets["critical"] + buckets["high"]
 
         if not sorted_items:
             return True
 
-        # 멘션 생성
-        mentions = ""
-        if self.mention_users:
-            mentions = " ".join(f"@{user}" for user in self.mention_users)
+        if dry_run:
+            logger.info(f"[DRY-RUN] 일괄 알림 발송: {len(sorted_items)}건")
+            return True
+
+        mentions = self._mentions_str
 
         # 헤더 블록
         blocks = [
@@ -156,27 +181,7 @@ class SlackNotifier:
         blocks.append({"type": "divider"})
 
         # 각 항목 추가
-        for item, analysis in sorted_items:
-            emoji = self.SEVERITY_EMOJI.get(analysis.severity, ":question:")
-            severity_upper = analysis.severity.upper()
-
-            # CVE ID 추출
-            cve_match = re.search(r"CVE-\d{4}-\d+", item.title, re.IGNORECASE)
-            cve_id = cve_match.group(0) if cve_match else ""
-
-            title = f"{emoji} [{severity_upper}] {item.title[:80]}"
-            if len(item.title) > 80:
-                title += "..."
-
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*<{item.url}|{title}>*\n"
-                           f"• 영향 기술: `{analysis.tech}`\n"
-                           f"• {analysis.summary}",
-                },
-            })
+        blocks.extend(self._format_item_block(item, analysis) for item, analysis in sorted_items)
 
         # Slack 블록 제한 (50개) 처리
         if len(blocks) > 50:
@@ -188,12 +193,26 @@ class SlackNotifier:
 
         message = {"blocks": blocks}
 
-        if dry_run:
-            logger.info(f"[DRY-RUN] 일괄 알림 발송: {len(sorted_items)}건")
-            return True
-
         return self._send(message)
 
+    def _format_item_block(self, item: FeedItem, analysis: AnalysisResult) -> dict:
+        """일괄 알림의 항목 하나를 section 블록으로 변환"""
+        emoji = self.SEVERITY_EMOJI.get(analysis.severity, ":question:")
+
+        title = f"{emoji} [{analysis.severity.upper()}] {item.title[:80]}"
+        if len(item.title) > 80:
+            title += "..."
+
+        return {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*<{item.url}|{title}>*\n"
+                       f"• 영향 기술: `{analysis.tech}`\n"
+                       f"• {analysis.summary}",
+            },
+        }
+
     def send_daily_summary(
         self,
         items: List[tuple[FeedItem, AnalysisResult]],
@@ -209,20 +228,22 @@ class SlackNotifier:
             logger.info("요약할 항목 없음")
             return True
 
-        # 심각도별 그룹화
-        by_severity = {"critical": [], "high": [], "medium": [], "low": []}
-        for item, analysis in items:
-            by_severity[analysis.severity].append((item, analysis))
+        if dry_run:
+            logger.info(f"[DRY-RUN] 일일 요약 발송: {len(items)}건")
+            return True
+
+        # 심각도별 건수 집계 (한 번 순회)
+        counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+        for _, analysis in items:
+            counts[analysis.severity] += 1
 
         # 메시지 구성
-        summary_lines = []
         total = len(items)
-
-        for severity in ["critical", "high", "medium", "low"]:
-            count = len(by_severity[severity])
-            if count > 0:
-                emoji = self.SEVERITY_EMOJI[severity]
-                summary_lines.append(f"{emoji} {severity.upper()}: {count}건")
+        summary_lines = [
+            f"{self.SEVERITY_EMOJI[severity]} {severity.upper()}: {count}건"
+            for severity, count in counts.items()
+            if count
+        ]
 
         blocks = [
             {
@@ -260,22 +281,36 @@ class SlackNotifier:
 
         message = {"blocks": blocks}
 
-        if dry_run:
-            logger.info(f"[DRY-RUN] 일일 요약 발송: {total}건")
-            return True
-
         return self._send(message)
 
+    @staticmethod
+    def _encode_payload(message: dict) -> bytes:
+        """메시지를 공백 없는 UTF-8 JSON으로 인코딩"""
+        # ensure_ascii=False: 한글을 이스케이프 시퀀스로 늘리지 않음
+        return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
     def _send(self, message: dict) -> bool:
         """Slack webhook으로 메시지 발송"""
+        return self._send_body(self._encode_payload(message))
+
+    def _send_body(self, body: bytes) -> bool:
+        """인코딩된 페이로드 발송 (재시도 시에도 같은 bytes를 그대로 재사용)"""
         try:
             logger.info(f"Slack API 호출 시작: {self.webhook_url[:50]}...")
-            
-            response = requests.post(
-                self.webhook_url,
-                json=message,
-                timeout=10,
-            )
+
+            for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+                response = self._session.post(
+                    self.webhook_url,
+                    data=body,
+                    headers={"Content-Type": "application/json; charset=utf-8"},
+                    timeout=10,
+                )
+                if response.status_code != 429 or attempt == self.RATE_LIMIT_RETRIES:
+                    break
+
+                wait = self._retry_after(response)
+                logger.warning(f"Slack rate limit (429), {wait}초 후 재시도 ({attempt + 1}/{self.RATE_LIMIT_RETRIES})")
+                time.sleep(wait)
 
             logger.info(f"Slack API 응답: status={response.status_code}, body={response.text[:200]}")
 
@@ -289,3 +324,11 @@ class SlackNotifier:
         except Exception as e:
             logger.error(f"Slack 알림 발송 오류: {e}")
             return False
+
+    def _retry_after(self, response: requests.Response) -> int:
+        """429 응답의 Retry-After(초) 값, 없거나 잘못된 값이면 1초"""
+        try:
+            wait = int(response.headers.get("Retry-After", 1))
+        except ValueError:
+            wait = 1
+        return min(max(wait, 1), self.MAX_RETRY_AFTER)
@@ -1,10 +1,11 @@
 """
 중복 제거 저장소
-JSON 파일 기반으로 처리된 항목을 추적
+SQLite 파일 기반으로 처리된 항목을 추적
 """
 
+import hashlib
 import json
-import os
+import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
@@ -12,98 +13,191 @@ from typing import Optional
 from models import FeedItem, ProcessedItem
 
 
+def content_hash(item: FeedItem) -> str:
+    """제목/링크/설명 기반 콘텐츠 해시 (GUID만 바뀐 재발행 항목 검출용)"""
+    payload = f"{item.title}|{item.url}|{item.description}".encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
 class DeduplicationStore:
-    """JSON 파일 기반 중복 제거 저장소"""
+    """SQLite 기반 중복 제거 저장소
+
+    항목 ID를 기본 키로 하는 processed 테이블에 기록하며,
+    first_seen(epoch 초)에 인덱스를 두어 오래된 항목을 범위 삭제
+    ID가 달라도 content_hash가 같은 항목은 이미 처리된 것으로 간주
+    """
+
+    # SQLite 바인딩 변수 개수 제한(구버전 999)을 넘지 않도록 IN 조회를 나눔
+    LOOKUP_CHUNK_SIZE = 500
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS processed (
+        id TEXT PRIMARY KEY,
+        first_seen INTEGER NOT NULL,
+        source TEXT,
+        title TEXT,
+        content_hash TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_first_seen ON processed(first_seen);
+    """
+
+    # PRAGMA user_version 값: 이전 JSON 저장소 이전을 마친 DB
+    LEGACY_IMPORTED_VERSION = 1
 
     def __init__(self, storage_path: str, retention_days: int = 90):
-        self.storage_path = Path(storage_path)
+        # 이전 버전의 JSON 경로가 설정되어 있어도 같은 이름의 .db 파일 사용
+        self.storage_path = Path(storage_path).with_suffix(".db")
         self.retention_days = retention_days
-        self._data: dict = {"processed_items": {}, "last_updated": None}
-        self._load()
 
-    def _load(self) -> None:
-        """저장소 파일 로드"""
-        if self.storage_path.exists():
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.storage_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._migrate()
+
+        # 파일 존재 여부가 아니라 DB에 기록된 완료 표시로 판단 (이전 실패 시 다음 실행에서 재시도)
+        user_version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if user_version < self.LEGACY_IMPORTED_VERSION:
+            self._import_legacy()
+
+    def _migrate(self) -> None:
+        """이전 스키마의 DB에 content_hash 컬럼과 인덱스 추가"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(processed)")}
+        with self._conn:
+            if "content_hash" not in columns:
+                self._conn.execute("ALTER TABLE processed ADD COLUMN content_hash TEXT")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_content_hash ON processed(content_hash)")
+
+    def _import_legacy(self) -> None:
+        """이전 버전의 processed.json 저장소가 있으면 새 DB로 옮김
+
+        항목 이전과 완료 표시(user_version)를 한 트랜잭션으로 기록하며,
+        파일을 읽지 못하면 완료 표시 없이 반환하여 다음 실행에서 다시 시도
+        """
+        legacy_path = self.storage_path.with_suffix(".json")
+        rows = []
+
+        if legacy_path.exists():
             try:
-                with open(self.storage_path, "r", encoding="utf-8") as f:
-                    self._data = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"[WARN] 저장소 파일 로드 실패, 새로 생성: {e}")
-                self._data = {"processed_items": {}, "last_updated": None}
-        else:
-            # 디렉토리가 없으면 생성
-            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-
-    def _save(self) -> None:
-        """저장소 파일 저장"""
-        self._data["last_updated"] = datetime.now().isoformat()
-        with open(self.storage_path, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, ensure_ascii=False, indent=2)
+                with open(legacy_path, "r", encoding="utf-8") as f:
+                    entries = json.load(f).get("processed_items", {})
+                entries = dict(entries)
+            except (json.JSONDecodeError, IOError, AttributeError, TypeError, ValueError) as e:
+                print(f"[WARN] 이전 저장소 파일 로드 실패: {e}")
+                return
+
+            for item_id, data in entries.items():
+                try:
+                    first_seen = int(datetime.fromisoformat(data["first_seen"]).timestamp())
+                    rows.append((item_id, first_seen, data.get("source"), data.get("title")))
+                except (KeyError, TypeError, ValueError, AttributeError) as e:
+                    print(f"[WARN] 이전 저장소 항목 건너뜀 ({item_id}): {e!r}")
+
+        with self._conn:
+            # 이미 DB에 있는 항목은 유지
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO processed (id, first_seen, source, title) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(f"PRAGMA user_version = {self.LEGACY_IMPORTED_VERSION}")
+
+        if rows:
+            print(f"[INFO] 이전 저장소에서 {len(rows)}개 항목 이전: {legacy_path}")
 
     def is_processed(self, item: FeedItem) -> bool:
-        """이미 처리된 항목인지 확인"""
-        return item.id in self._data["processed_items"]
+        """이미 처리된 항목인지 확인 (ID 또는 콘텐츠 해시 기준)"""
+        row = self._conn.execute(
+            "SELECT 1 FROM processed WHERE id = ? OR content_hash = ?",
+            (item.id, content_hash(item)),
+        ).fetchone()
+        return row is not None
 
     def mark_processed(self, item: FeedItem) -> None:
         """항목을 처리 완료로 표시"""
-        self._data["processed_items"][item.id] = {
-            "first_seen": datetime.now().isoformat(),
-            "source": item.source,
-            "title": item.title,
-        }
-        self._save()
+        self.mark_all_processed([item])
 
     def get_processed_item(self, item_id: str) -> Optional[ProcessedItem]:
         """처리된 항목 조회"""
-        if item_id not in self._data["processed_items"]:
+        row = self._conn.execute(
+            "SELECT first_seen, source, title, content_hash FROM processed WHERE id = ?", (item_id,)
+        ).fetchone()
+        if row is None:
             return None
 
-        data = self._data["processed_items"][item_id]
+        first_seen, source, title, item_hash = row
         return ProcessedItem(
             id=item_id,
-            first_seen=datetime.fromisoformat(data["first_seen"]),
-            source=data["source"],
-            title=data["title"],
+            first_seen=datetime.fromtimestamp(first_seen),
+            source=source,
+            title=title,
+            content_hash=item_hash,
         )
 
     def cleanup_old_entries(self) -> int:
         """retention_days 이상 된 항목 삭제, 삭제된 항목 수 반환"""
-        cutoff = datetime.now() - timedelta(days=self.retention_days)
-        items_to_remove = []
-
-        for item_id, data in self._data["processed_items"].items():
-            first_seen = datetime.fromisoformat(data["first_seen"])
-            if first_seen < cutoff:
-                items_to_remove.append(item_id)
+        cutoff = int((datetime.now() - timedelta(days=self.retention_days)).timestamp())
 
-        for item_id in items_to_remove:
-            del self._data["processed_items"][item_id]
+        with self._conn:
+            deleted = self._conn.execute("DELETE FROM processed WHERE first_seen < ?", (cutoff,)).rowcount
 
-        if items_to_remove:
-            self._save()
-            print(f"[INFO] {len(items_to_remove)}개의 오래된 항목 삭제됨")
+        if deleted:
+            print(f"[INFO] {deleted}개의 오래된 항목 삭제됨")
 
-        return len(items_to_remove)
+        return deleted
 
     def get_stats(self) -> dict:
         """저장소 통계 반환"""
+        total, last_seen = self._conn.execute("SELECT COUNT(*), MAX(first_seen) FROM processed").fetchone()
         return {
-            "total_items": len(self._data["processed_items"]),
-            "last_updated": self._data["last_updated"],
+            "total_items": total,
+            "last_updated": datetime.fromtimestamp(last_seen).isoformat() if last_seen else None,
             "storage_path": str(self.storage_path),
         }
 
     def filter_new_items(self, items: list[FeedItem]) -> list[FeedItem]:
-        """새 항목만 필터링하여 반환"""
-        return [item for item in items if not self.is_processed(item)]
+        """새 항목만 필터링하여 반환
+
+        항목마다 조회하는 대신 ID/콘텐츠 해시를 묶어 IN 쿼리로 한 번에 확인하고,
+        같은 배치 안에서 내용이 같은 항목도 하나만 남김
+        """
+        hashes = [content_hash(item) for item in items]
+        existing_ids = self._existing("id", {item.id for item in items})
+        seen_hashes = self._existing("content_hash", set(hashes))
+
+        new_items = []
+        for item, item_hash in zip(items, hashes):
+            if item.id in existing_ids or item_hash in seen_hashes:
+                continue
+            seen_hashes.add(item_hash)
+            new_items.append(item)
+        return new_items
+
+    def _existing(self, column: str, values: set[str]) -> set[str]:
+        """column 값 중 이미 저장된 값 집합 반환"""
+        values = list(values)
+        existing = set()
+        for start in range(0, len(values), self.LOOKUP_CHUNK_SIZE):
+            chunk = values[start:start + self.LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            existing.update(
+                row[0] for row in self._conn.execute(
+                    f"SELECT {column} FROM processed WHERE {column} IN ({placeholders})", chunk
+                )
+            )
+        return existing
 
     def mark_all_processed(self, items: list[FeedItem]) -> None:
-        """여러 항목을 한 번에 처리 완료로 표시 (배치 저장)"""
-        for item in items:
-            self._data["processed_items"][item.id] = {
-                "first_seen": datetime.now().isoformat(),
-                "source": item.source,
-                "title": item.title,
-            }
-        if items:
-            self._save()
+        """여러 항목을 한 번에 처리 완료로 표시 (단일 트랜잭션)"""
+        now = int(datetime.now().timestamp())
+        rows = [(item.id, now, item.source, item.title, content_hash(item)) for item in items]
+        if not rows:
+            return
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO processed (id, first_seen, source, title, content_hash) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
@@ -0,0 +1,82 @@
+"""
+GemmaAnalyzer.analyze_batch 테스트
+"""
+
+import sys
+import threading
+import types
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+try:
+    from google import genai  # noqa: F401
+except ImportError:
+    # google-genai 미설치 환경: 클라이언트는 테스트에서 교체하므로 모듈 자리만 채움
+    google = sys.modules.setdefault("google", types.ModuleType("google"))
+    google.genai = types.SimpleNamespace(Client=lambda **kwargs: None)
+    sys.modules["google.genai"] = google.genai
+
+from llm import GemmaAnalyzer
+from models import FeedItem
+
+
+class _FakeModels:
+    """generate_content 호출을 기록하고 고정 JSON 응답 반환"""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, model, contents):
+        with self._lock:
+            self.calls += 1
+        return types.SimpleNamespace(
+            text='{"affected_product": "nginx", "severity": "high", "summary": "요약"}'
+        )
+
+
+def _item(n: int) -> FeedItem:
+    return FeedItem(
+        id=f"test:{n}",
+        source="test",
+        title=f"nginx 취약점 {n}",
+        description="설명",
+        url=f"https://example.com/{n}",
+        published_at=datetime.now(),
+    )
+
+
+class AnalyzeBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = GemmaAnalyzer(api_key="test", whitelist=["nginx"])
+        self.models = _FakeModels()
+        self.analyzer.client = types.SimpleNamespace(models=self.models)
+
+    def test_repeated_batches_on_one_analyzer(self):
+        first = self.analyzer.analyze_batch([_item(1), _item(2)], concurrency=2)
+        second = self.analyzer.analyze_batch([_item(3), _item(4)], concurrency=2)
+
+        for item, result in first + second:
+            self.assertIsNotNone(result, item.id)
+            self.assertTrue(result.is_relevant)
+        self.assertEqual([item.id for item, _ in second], ["test:3", "test:4"])
+        self.assertEqual(self.models.calls, 4)
+
+    def test_duplicate_and_cached_prompts_call_llm_once(self):
+        self.analyzer.analyze_batch([_item(1), _item(1)])
+        results = self.analyzer.analyze_batch([_item(1)])
+
+        self.assertIsNotNone(results[0][1])
+        self.assertEqual(self.models.calls, 1)
+
+    def test_non_positive_concurrency(self):
+        results = self.analyzer.analyze_batch([_item(1)], concurrency=0)
+
+        self.assertIsNotNone(results[0][1])
+
+
+if __name__ == "__main__":
+    unittest.main()